@@ -10,15 +10,34 @@ from __future__ import annotations
 
 # Standard library ------------------------------------------------------------------
 import argparse
+import functools
+import hashlib
+import io
 import json
 import logging
 import os
 import re
+import signal
+import socket
+import socketserver
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, List, Tuple
+from pathlib import Path, PurePath
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 # Third‑party packages ---------------------------------------------------------------
 try:
@@ -26,20 +45,66 @@ try:
 except ModuleNotFoundError:  # Python ≤ 3.10
     import tomli as tomllib  # type: ignore
 
-try:
-    import deepl  # DeepL SDK
+# `deepl` and `dotenv` pull in requests/urllib3 and are only needed once we actually
+# translate, so they are imported lazily (see *_import_deepl* and *load_api_key*). The
+# optional `pygit2` is likewise only imported once the repository is first needed.
+if TYPE_CHECKING:
+    import deepl
+    import pygit2
+
+try:  # optional C (de)serialiser, reads and writes bytes directly
+    from orjson import OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialise *obj* to indented UTF‑8 JSON."""
+        return _orjson_dumps(obj, option=OPT_INDENT_2)
+
 except ModuleNotFoundError:
-    print("deepl package not installed. Install with 'pip install deepl'.", file=sys.stderr)
-    sys.exit(1)
+    json_loads = json.loads
 
-from dotenv import load_dotenv
+    def json_dumps(obj: Any) -> bytes:
+        """Serialise *obj* to indented UTF‑8 JSON."""
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 # ---------------------------------------------------------------------------
 # Repository helpers
 # ---------------------------------------------------------------------------
 
-def detect_repo_root() -> Path:
-    """Return the git repository root or *cwd* if we're not inside a git repo."""
+@functools.cache
+def _repository() -> pygit2.Repository | None:
+    """Return the enclosing repository via libgit2, or *None* if pygit2 can't be used."""
+    try:
+        import pygit2  # libgit2 bindings – optional, saves spawning `git` for every call
+    except ModuleNotFoundError:
+        return None
+    try:
+        # FROM_ENV makes libgit2 honour GIT_DIR, GIT_WORK_TREE and above all GIT_INDEX_FILE,
+        # which git points at a temporary index for `commit -a` and `commit <path>`.
+        flags = pygit2.enums.RepositoryOpenFlag.FROM_ENV
+        repo = pygit2.Repository(str(Path.cwd()), flags=flags)
+        index_file = os.environ.get("GIT_INDEX_FILE")
+        if index_file and not os.path.isabs(index_file) and repo.workdir:
+            # git resolves a relative GIT_INDEX_FILE against the top of the work tree, libgit2
+            # against the cwd: pin the file git means, for libgit2 and git subprocesses alike.
+            os.environ["GIT_INDEX_FILE"] = str(Path(repo.workdir) / index_file)
+            repo = pygit2.Repository(str(Path.cwd()), flags=flags)
+        return repo
+    except Exception as exc:
+        logging.debug("pygit2 unavailable, falling back to git CLI: %s", exc)
+        return None
+
+
+@functools.cache
+def repo_root() -> Path:
+    """Return the git repository root or *cwd* if we're not inside a git repo.
+
+    Resolved on first use rather than at import, so importing this module stays cheap.
+    """
+    repo = _repository()
+    if repo is not None and repo.workdir:
+        return Path(repo.workdir)
     try:
         root = subprocess.check_output(
             ["git", "rev-parse", "--show-toplevel"],
@@ -51,24 +116,121 @@ def detect_repo_root() -> Path:
         return Path.cwd()
 
 
-REPO_ROOT: Path = detect_repo_root()
+@functools.cache
+def git_dir() -> Path | None:
+    """Return the repository's git directory (honouring *GIT_DIR*), or *None* outside git."""
+    repo = _repository()
+    if repo is not None:
+        return Path(repo.path)
+    try:
+        path = subprocess.check_output(
+            ["git", "rev-parse", "--absolute-git-dir"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+        return Path(path)
+    except Exception:
+        return None
+
+
+def readme_path() -> Path:
+    """Return the source README of the current repository."""
+    return repo_root() / "README.md"
+
+
 SCRIPT_DIR: Path = Path(__file__).resolve().parent
-README_PATH: Path = REPO_ROOT / "README.md"
+
+
+def staged_files() -> List[str]:
+    """Return the repo‑relative paths staged for the next commit."""
+    repo = _repository()
+    if repo is not None:
+        index = repo.index
+        index.read()
+        if repo.head_is_unborn:  # first commit: everything in the index is staged
+            return [entry.path for entry in index]
+        return [delta.new_file.path for delta in index.diff_to_tree(repo.head.peel().tree).deltas]
+    # -z: NUL-separated and unquoted, so names with newlines or non-ASCII bytes survive.
+    result = subprocess.run(
+        ["git", "diff", "--cached", "--name-only", "-z"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return [name for name in result.stdout.split("\0") if name]
+
+
+def read_staged(path: Path) -> str:
+    """Return *path* as staged in the index, falling back to the working‑tree file.
+
+    The index is what is about to be committed, so partial stages (`git add -p`) are
+    translated as committed rather than as currently on disk.
+    """
+    try:
+        rel = path.resolve().relative_to(repo_root().resolve()).as_posix()
+    except ValueError:  # outside the repository
+        return path.read_text("utf-8")
+    repo = _repository()
+    if repo is not None:
+        index = repo.index
+        index.read()
+        try:
+            data: bytes | None = repo[index[rel].id].data
+        except KeyError:  # not tracked
+            data = None
+    else:
+        result = subprocess.run(
+            ["git", "show", f":{rel}"], capture_output=True, check=False, cwd=repo_root()
+        )
+        data = result.stdout if result.returncode == 0 else None
+    if data is None:
+        return path.read_text("utf-8")
+    # Same newline translation as read_text().
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def stage(paths: Iterable[Path]) -> None:
+    """`git add` *paths*, in‑process when libgit2 is available."""
+    paths = list(paths)
+    repo = _repository()
+    if repo is not None:
+        try:
+            index = repo.index
+            index.read()
+            for path in paths:
+                index.add(path.resolve().relative_to(repo_root().resolve()).as_posix())
+            index.write()
+            return
+        except Exception as exc:
+            logging.debug("pygit2 could not stage files, falling back to git CLI: %s", exc)
+    subprocess.run(["git", "add", *map(str, paths)], check=False)
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
 
-@dataclass(slots=True)
+def _default_cache_dir() -> Path:
+    """Keep caches inside the git directory so they never show up as untracked files."""
+    directory = git_dir()
+    if directory is None:  # not a git checkout – nothing to gitignore either
+        return repo_root() / ".readme-i18n-cache"
+    return directory / "readme-i18n"
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
-    """All tweakable parameters live here so they are easy to override via *pyproject.*"""
+    """All tweakable parameters live here so they are easy to override via *pyproject.*
+
+    Frozen (and therefore hashable) so derived data can be memoised per configuration.
+    """
 
     source_lang: str = "EN"
-    languages: List[str] = field(default_factory=lambda: ["DE"])
-    output_dir: Path = REPO_ROOT / "translations"
+    languages: Tuple[str, ...] = ("DE",)
+    output_dir: Path = field(default_factory=lambda: repo_root() / "translations")
     template: str = "{basename}.{lang}{ext}"
-    header_template_path: Path = REPO_ROOT / ".readme-i18n-header.md"
+    header_template_path: Path = field(default_factory=lambda: repo_root() / ".readme-i18n-header.md")
+    cache_dir: Path = field(default_factory=_default_cache_dir)
     marker_start: str = "<!-- readme-i18n start -->"
     marker_end: str = "<!-- readme-i18n end -->"
 
@@ -79,96 +241,165 @@ class Config:
     @classmethod
     def load(cls) -> "Config":
         """Load overrides from *pyproject.toml* (section *[tool.readme-i18n]*) if present."""
-        defaults = cls()
-        pyproject = REPO_ROOT / "pyproject.toml"
-        if not pyproject.exists():
-            return defaults
+        pyproject = repo_root() / "pyproject.toml"
+        try:
+            stat = pyproject.stat()
+        except FileNotFoundError:
+            return cls()
+        return cls._parse(pyproject, stat.st_mtime_ns, stat.st_size)
 
-        cfg = tomllib.load(pyproject.open("rb")).get("tool", {}).get("readme-i18n", {})
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse(cls, pyproject: Path, mtime_ns: int, size: int) -> "Config":
+        """Parse *pyproject*; *mtime_ns*/*size* only key the cache so edits are picked up."""
+        defaults = cls()
+        root = pyproject.parent
+        with pyproject.open("rb") as fh:
+            cfg = tomllib.load(fh).get("tool", {}).get("readme-i18n", {})
+        # Codes keep their configured spelling, which ends up in the file names; lookups
+        # (flags, labels, DeepL's target_lang) upper-case them where needed.
+        source_lang = cfg.get("source_lang", defaults.source_lang)
         return cls(
-            source_lang=cfg.get("source_lang", defaults.source_lang),
-            languages=cfg.get("languages", defaults.languages),
-            output_dir=REPO_ROOT / cfg.get("output_dir", defaults.output_dir.name),
+            source_lang=source_lang,
+            # Translating into the source language is a no‑op, so never schedule it.
+            languages=tuple(
+                code
+                for code in cfg.get("languages", defaults.languages)
+                if code.upper() != source_lang.upper()
+            ),
+            output_dir=root / cfg.get("output_dir", defaults.output_dir.name),
             template=cfg.get("template", defaults.template),
-            header_template_path=REPO_ROOT / cfg.get("header_template_path", defaults.header_template_path.name),
+            header_template_path=root
+            / cfg.get("header_template_path", defaults.header_template_path.name),
+            cache_dir=root / cfg["cache_dir"] if "cache_dir" in cfg else defaults.cache_dir,
             marker_start=cfg.get("marker_start", defaults.marker_start),
             marker_end=cfg.get("marker_end", defaults.marker_end),
         )
 
 
 # ---------------------------------------------------------------------------
-# Flag‑emoji mapping (used in the generated header)
+# Flag‑emoji mapping & static labels (used in the generated header)
 # ---------------------------------------------------------------------------
 
 
+TableStamp = Tuple[Tuple[Path, int, int], ...]
+
+
+def _table_stamp(name: str) -> TableStamp:
+    """Return *(path, mtime_ns, size)* of every existing candidate file for table *name*."""
+    stamp = []
+    for fp in (repo_root() / name, SCRIPT_DIR.parent / name):
+        try:
+            st = fp.stat()
+        except OSError:
+            continue
+        stamp.append((fp, st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_table(stamp: TableStamp) -> Dict[str, Any]:
+    """Return the first JSON object in *stamp* keyed by upper‑cased language code ({} if none).
+
+    Keyed on mtime and size, so a long-lived daemon picks up edits to the tables.
+    """
+    for fp, _, _ in stamp:
+        try:
+            data = json_loads(fp.read_bytes())
+            if isinstance(data, dict):
+                return {k.upper(): v for k, v in data.items()}
+        except Exception as exc:
+            logging.warning("Failed to load %s: %s", fp, exc)
+    return {}
+
+
 def _load_flags() -> Dict[str, str]:
     """Return a *code → emoji* mapping. Falls back to an empty dict if not found."""
-    for fp in (REPO_ROOT / "flags.json", SCRIPT_DIR.parent / "flags.json"):
-        if fp.exists():
-            try:
-                data = json.load(fp.open())
-                if isinstance(data, dict):
-                    return {k.upper(): v for k, v in data.items()}
-            except Exception as exc:
-                logging.warning("Failed to load %s: %s", fp, exc)
-    return {}
+    return _read_table(_table_stamp("flags.json"))
 
 
-FLAGS: Dict[str, str] = _load_flags()
 CREDIT_LINK = '<a href="https://github.com/Sprtacus/readme-i18n/">readme-i18n</a>'
+# Static strings of the generated header, translated in the same request as the body.
+HEADER_STRINGS: Tuple[str, str] = ("Languages:", f"generated with {CREDIT_LINK} using DeepL")
+
+
+def _load_static_labels() -> Dict[str, Tuple[str, str]]:
+    """Return bundled *code → HEADER_STRINGS* translations so headers need no API call."""
+    return _static_labels(_table_stamp("header_labels.json"))
+
+
+@functools.lru_cache(maxsize=4)
+def _static_labels(stamp: TableStamp) -> Dict[str, Tuple[str, str]]:
+    labels: Dict[str, Tuple[str, str]] = {}
+    for code, entry in _read_table(stamp).items():
+        if isinstance(entry, dict) and {"languages", "credit"} <= entry.keys():
+            labels[code] = (entry["languages"], entry["credit"].format(link=CREDIT_LINK))
+    return labels
+
 
 # ---------------------------------------------------------------------------
 # Segment protection (code blocks, inline code & emoji)
 # ---------------------------------------------------------------------------
 
+# Code‑point table of everything treated as a single emoji character. The ranges are
+# folded into ONE character class, which `re` compiles into a per‑character table lookup
+# instead of backtracking through an alternation of ranges.
+EMOJI_RANGES: Tuple[Tuple[int, int], ...] = (
+    (0x1F600, 0x1F64F),  # Emoticons
+    (0x1F300, 0x1F5FF),  # Symbols & Pictographs
+    (0x1F680, 0x1F6FF),  # Transport & Map
+    (0x02600, 0x026FF),  # Misc symbols
+    (0x02700, 0x027BF),  # Dingbats
+    (0x1F900, 0x1F9FF),  # Supplemental symbols
+    (0x1FA70, 0x1FAFF),  # Extended‑A
+    (0x02500, 0x02BEF),  # Box drawing & co.
+    (0x1F018, 0x1F270),  # Older pictographs
+    (0x1F000, 0x1F02F),  # Mahjong & domino
+)
+
+EMOJI_CHARS = "".join(f"\\U{lo:08X}-\\U{hi:08X}" for lo, hi in EMOJI_RANGES)
 EMOJI_PATTERN = (
-    "[\U0001F600-\U0001F64F]"      # Emoticons
-    "|[\U0001F300-\U0001F5FF]"     # Symbols & Pictographs
-    "|[\U0001F680-\U0001F6FF]"     # Transport & Map
-    "|[\U0001F1E6-\U0001F1FF]{2}"  # Regional indicator (flags)
-    "|[\U00002600-\U000026FF]"     # Misc symbols
-    "|[\U00002700-\U000027BF]"     # Dingbats
-    "|[\U0001F900-\U0001F9FF]"     # Supplemental symbols
-    "|[\U0001FA70-\U0001FAFF]"     # Extended‑A
-    "|[\U00002500-\U00002BEF]"     # Box drawing & co.
-    "|[\U0001F018-\U0001F270]"     # Older pictographs
-    "|[\U0001F000-\U0001F02F]"     # Mahjong & domino
+    "[\U0001F1E6-\U0001F1FF]{2}"  # Regional indicator pair (flags) – must win over single chars
+    f"|[{EMOJI_CHARS}]"
 )
 
 EMOJI_MODIFIERS = "[\U0001F3FB-\U0001F3FF\U0000200D\U0000FE0F]"
 FULL_EMOJI_PATTERN = rf"(?:{EMOJI_PATTERN})(?:{EMOJI_MODIFIERS})*"
 
+# All patterns below are compiled once at import; the only marker‑dependent one is built
+# (and memoised per marker pair) by *_header_pattern*.
 EXCLUSION_PATTERN = re.compile(
-    rf"""(
-        ```[\s\S]*?```          # Fenced code‑block
-      | `[^`\n]+`                # Inline code
-      | {FULL_EMOJI_PATTERN}     # Emoji (with modifiers)
-    )""",
-    re.VERBOSE,
+    f"(?=[`\U0001F1E6-\U0001F1FF{EMOJI_CHARS}])"  # One class test rejects ordinary characters
+    r"(```[\s\S]*?```"  # Fenced code‑block
+    r"|`[^`\n]+`"  # Inline code
+    f"|{FULL_EMOJI_PATTERN})"  # Emoji (with modifiers)
 )
 
 
-def protect_segments(text: str) -> Tuple[str, Dict[str, str]]:
-    """Replace sensitive segments with sentinels so DeepL won't mangle them."""
-    mapping: Dict[str, str] = {}
-    counter = 0
+SENTINEL_PATTERN = re.compile(r"__RMI18N_(\d+)__")
+
+
+def protect_segments(text: str) -> Tuple[str, List[str]]:
+    """Replace sensitive segments with sentinels so DeepL won't mangle them.
+
+    The returned list holds the original snippets; sentinel *n* refers to index *n*.
+    """
+    # EXCLUSION_PATTERN has exactly one capturing group, so split() yields the plain text
+    # at even and the matched snippets at odd indices – all in one pass inside the C engine.
+    parts = EXCLUSION_PATTERN.split(text)
+    mapping = parts[1::2]
+    parts[1::2] = [f"__RMI18N_{i}__" for i in range(len(mapping))]
+    return "".join(parts), mapping
 
-    def _repl(match: re.Match[str]) -> str:  # type: ignore[type-var]
-        nonlocal counter
-        token = f"__RMI18N_{counter}__"
-        mapping[token] = match.group(0)
-        counter += 1
-        return token
 
-    cleaned = EXCLUSION_PATTERN.sub(_repl, text)
-    return cleaned, mapping
+def restore_segments(text: str, mapping: List[str]) -> str:
+    """Undo *protect_segments* by substituting the original snippets back in (single pass)."""
 
+    def _repl(match: re.Match[str]) -> str:  # type: ignore[type-var]
+        index = int(match.group(1))
+        return mapping[index] if index < len(mapping) else match.group(0)
 
-def restore_segments(text: str, mapping: Dict[str, str]) -> str:
-    """Undo *protect_segments* by substituting the original snippets back in."""
-    for token, original in mapping.items():
-        text = text.replace(token, original)
-    return text
+    return SENTINEL_PATTERN.sub(_repl, text)
 
 # ---------------------------------------------------------------------------
 # Header helpers
@@ -176,156 +407,743 @@ def restore_segments(text: str, mapping: Dict[str, str]) -> str:
 
 
 def _load_header_template(cfg: Config) -> str:
-    """Return the raw header template (ensuring start/end markers are present)."""
-    if cfg.header_template_path.exists():
-        raw = cfg.header_template_path.read_text("utf-8")
+    """Return the raw header template (ensuring start/end markers are present).
+
+    The file is read once and then served from cache until its mtime or size changes,
+    which matters for the long-lived daemon.
+    """
+    try:
+        st = cfg.header_template_path.stat()
+        stamp: Tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        stamp = None
+    return _read_header_template(cfg.header_template_path, stamp, cfg.marker_start, cfg.marker_end)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_header_template(
+    path: Path,
+    stamp: Tuple[int, int] | None,
+    marker_start: str,
+    marker_end: str,
+) -> str:
+    if stamp is not None:
+        raw = path.read_text("utf-8")
     else:
         raw = (
             "<p align=\"right\">\n  <strong>{languages_label}</strong> {links}<br>\n"
             "  <sub>{credit}</sub>\n</p>"
         )
 
-    if cfg.marker_start not in raw:
-        raw = f"{cfg.marker_start}\n{raw}"
-    if cfg.marker_end not in raw:
-        raw = f"{raw}\n{cfg.marker_end}"
+    if marker_start not in raw:
+        raw = f"{marker_start}\n{raw}"
+    if marker_end not in raw:
+        raw = f"{raw}\n{marker_end}"
     return raw
 
 
 def _relpath(target: Path, base: Path) -> str:
     """Return a POSIX‑style relative path from *base* to *target*."""
-    return os.path.relpath(target, base).replace(os.sep, "/")
+    try:
+        return target.relative_to(base).as_posix()
+    except ValueError:  # *target* is not below *base*, so "../" segments are needed
+        return PurePath(os.path.relpath(target, base)).as_posix()
+
 
+def _target_path(readme: Path, lang: str, cfg: Config) -> Path:
+    """Return where the *lang* translation of *readme* is written."""
+    return cfg.output_dir / cfg.template.format(basename=readme.stem, lang=lang, ext=readme.suffix)
 
-def _build_links(cfg: Config, cur_file: Path) -> str:
-    """Build the language switcher used in every generated header."""
-    base = cur_file.parent
+
+def _build_links(cfg: Config, base: Path) -> str:
+    """Build the language switcher used in every generated header living in *base*."""
+    return _links(cfg, base, _table_stamp("flags.json"))
+
+
+@functools.lru_cache(maxsize=64)
+def _links(cfg: Config, base: Path, flags_stamp: TableStamp) -> str:
+    flags = _read_table(flags_stamp)
     parts: List[str] = []
 
     def _add(label: str, dest: Path, code: str) -> None:
-        parts.append(f'<a href="{_relpath(dest, base)}">{FLAGS.get(code.upper(), "")} {label}</a>')
+        parts.append(f'<a href="{_relpath(dest, base)}">{flags.get(code.upper(), "")} {label}</a>')
 
-    _add(cfg.source_lang, README_PATH, cfg.source_lang)
+    _add(cfg.source_lang, readme_path(), cfg.source_lang)
     for code in cfg.languages:
-        fname = cfg.template.format(basename=README_PATH.stem, lang=code, ext=README_PATH.suffix)
-        _add(code, cfg.output_dir / fname, code)
+        _add(code, _target_path(readme_path(), code, cfg), code)
 
     return " ·\n  ".join(parts)
 
 
-def _translate(text: str, lang: str, tr: deepl.Translator | None) -> str:
-    """Wrapper around DeepL to keep *None* translator or *EN* no‑ops concise."""
-    if lang == "EN" or tr is None:
-        return text
-    try:
-        return tr.translate_text(text, target_lang=lang).text
-    except Exception:  # noqa: BLE001 – catching everything is deliberate here
-        return text
+def _header_labels(lang: str, labels: Sequence[str] | None) -> Sequence[str]:
+    """Return *labels* (translated by *translate_body*), the bundled ones or *HEADER_STRINGS*."""
+    return labels or _load_static_labels().get(lang.upper()) or HEADER_STRINGS
 
 
-def _build_header(cfg: Config, file_: Path, lang: str, tr: deepl.Translator | None) -> str:
+def _build_header(
+    cfg: Config,
+    file_: Path,
+    lang: str,
+    labels: Sequence[str] | None = None,
+) -> str:
+    """Render the header; *labels* are the already translated *HEADER_STRINGS* if known."""
+    languages_label, credit = _header_labels(lang, labels)
     return _load_header_template(cfg).format(
-        links=_build_links(cfg, file_),
-        languages_label=_translate("Languages:", lang, tr),
-        credit=_translate(f"generated with {CREDIT_LINK} using DeepL", lang, tr),
+        links=_build_links(cfg, file_.parent),
+        languages_label=languages_label,
+        credit=credit,
     )
 
 
+@functools.lru_cache(maxsize=16)
+def _header_pattern(marker_start: str, marker_end: str) -> re.Pattern[str]:
+    """Compile the header‑matching regex once per marker pair."""
+    return re.compile(rf"{re.escape(marker_start)}[\s\S]*?{re.escape(marker_end)}\n?", re.I)
+
+
 def _strip_header(text: str, cfg: Config) -> str:
     """Remove a previously inserted header so we don't nest them on regen."""
-    return re.sub(
-        rf"{re.escape(cfg.marker_start)}[\s\S]*?{re.escape(cfg.marker_end)}\n?",
-        "",
-        text,
-        flags=re.I,
-    ).lstrip()
-
-
-def ensure_header(path: Path, cfg: Config, lang: str, tr: deepl.Translator | None) -> bool:
-    """Add (or update) the header of *path* in‑place. Returns *True* if changed."""
-    original = path.read_text("utf-8") if path.exists() else ""
-    body = _strip_header(original, cfg)
-    new_content = f"{_build_header(cfg, path, lang, tr)}\n\n{body}".rstrip() + "\n"
-    if new_content != original:
-        path.write_text(new_content, "utf-8")
-        logging.info("Header updated in %s", path.relative_to(REPO_ROOT))
-        return True
-    return False
+    return _header_pattern(cfg.marker_start, cfg.marker_end).sub("", text).lstrip()
+
+
+@functools.lru_cache(maxsize=16)
+def _header_bytes_pattern(marker_start: str, marker_end: str) -> re.Pattern[bytes]:
+    """Byte-level twin of *_header_pattern*; only equivalent for ASCII markers."""
+    return re.compile(_header_pattern(marker_start, marker_end).pattern.encode("ascii"), re.I)
+
+
+# Lead bytes of UTF-8 sequences plus the ASCII separators \x1c-\x1f: str.strip() may treat
+# these as whitespace where bytes.strip() does not, so such edges take the text path.
+_UNSAFE_EDGE = frozenset(range(0x1C, 0x20)) | frozenset(range(0x80, 0x100))
+
+
+def _splice_header(data: bytes, header: str, cfg: Config) -> bytes | None:
+    """Swap the header at the top of *data* for *header* without decoding the file.
+
+    Returns the bytes *_strip_header* + *_with_header* would produce, or *None* when that
+    can't be guaranteed at byte level (no leading header, CRLF line endings, non‑ASCII
+    markers, a second header or non‑ASCII whitespace at the edges).
+    """
+    if not (cfg.marker_start.isascii() and cfg.marker_end.isascii()) or b"\r" in data:
+        return None
+    pattern = _header_bytes_pattern(cfg.marker_start, cfg.marker_end)
+    match = pattern.match(data)
+    if match is None or pattern.search(data, match.end()) is not None:
+        return None
+    body = data[match.end():].lstrip()
+    new = (header.encode("utf-8") + b"\n\n" + body).rstrip()
+    if body[:1] and body[0] in _UNSAFE_EDGE or new[-1] in _UNSAFE_EDGE:
+        return None
+    return new + b"\n"
+
+
+FINGERPRINT_TEMPLATE = "<!-- readme-i18n src-sha256:{} -->"
+FINGERPRINT_PATTERN = re.compile(r"<!-- readme-i18n src-sha256:([0-9a-f]{64}) -->")
+
+
+def _with_header(
+    body: str,
+    path: Path,
+    cfg: Config,
+    lang: str,
+    labels: Sequence[str] | None = None,
+    fingerprint: str | None = None,
+) -> str:
+    """Return the full content of *path*: a freshly built header followed by *body*.
+
+    A *fingerprint* (see *_fingerprint*) is embedded right after the start marker so it is
+    removed together with the header by *_strip_header*.
+    """
+    header = _build_header(cfg, path, lang, labels)
+    if fingerprint is not None:
+        stamp = FINGERPRINT_TEMPLATE.format(fingerprint)
+        header = header.replace(cfg.marker_start, f"{cfg.marker_start}\n{stamp}", 1)
+    return f"{header}\n\n{body}".rstrip() + "\n"
+
+
+def _fingerprint(body: str, cfg: Config, target: Path) -> str:
+    """Hash everything a generated file depends on: source body, header template & links."""
+    digest = hashlib.sha256(body.encode("utf-8"))
+    digest.update(_load_header_template(cfg).encode("utf-8"))
+    digest.update(_build_links(cfg, target.parent).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _is_current(target: Path, fingerprint: str) -> bool:
+    """Return *True* if *target* was generated from exactly this source and config."""
+    try:
+        match = FINGERPRINT_PATTERN.search(target.read_text("utf-8"))
+    except FileNotFoundError:
+        return False
+    return match is not None and match.group(1) == fingerprint
+
+
+def _header_digest(cfg: Config, path: Path, lang: str, labels: Sequence[str] | None) -> str:
+    """Hash the inputs of the header of *path* other than the file itself."""
+    digest = hashlib.sha256(_load_header_template(cfg).encode("utf-8"))
+    digest.update(_build_links(cfg, path.parent).encode("utf-8"))
+    digest.update(repr(tuple(_header_labels(lang, labels))).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_mtimes(cfg: Config) -> Dict[str, List[Any]]:
+    """Return the *path → [mtime_ns, size, header digest]* records of headers known current."""
+    try:
+        data = json_loads((cfg.cache_dir / "mtimes.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_mtimes(cfg: Config, mtimes: Dict[str, List[Any]]) -> None:
+    path = cfg.cache_dir / "mtimes.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(json_dumps(mtimes))
+    except OSError as exc:
+        logging.debug("Could not record header mtimes in %s: %s", path, exc)
+
+
+def ensure_header(
+    path: Path,
+    cfg: Config,
+    lang: str,
+    labels: Sequence[str] | None = None,
+) -> bool:
+    """Add (or update) the header of *path* in‑place. Returns *True* if changed.
+
+    Files whose mtime and size still match the record written after the last check are
+    skipped without being read, as long as the header inputs (template, links, labels)
+    are unchanged too.
+    """
+    mtimes = _load_mtimes(cfg)
+    digest = _header_digest(cfg, path, lang, labels)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None and mtimes.get(str(path)) == [st.st_mtime_ns, st.st_size, digest]:
+        return False
+
+    # Usually only the header region can differ, so splice it in at byte level and skip the
+    # UTF‑8 decode/encode round-trip; anything unusual goes through the text path below.
+    original = path.read_bytes() if st is not None else b""
+    header = _build_header(cfg, path, lang, labels)
+    spliced = _splice_header(original, header, cfg)
+    if spliced is not None:
+        changed = spliced != original
+        if changed:
+            path.write_bytes(spliced)
+    else:
+        # Same newline translation as read_text().
+        text = original.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        new_content = f"{header}\n\n{_strip_header(text, cfg)}".rstrip() + "\n"
+        changed = new_content != text
+        if changed:
+            path.write_text(new_content, "utf-8")
+    if changed:
+        logging.info("Header updated in %s", path.relative_to(repo_root()))
+        st = path.stat()
+    record = [st.st_mtime_ns, st.st_size, digest]
+    if mtimes.get(str(path)) != record:
+        mtimes[str(path)] = record
+        _save_mtimes(cfg, mtimes)
+    return changed
+
+# ---------------------------------------------------------------------------
+# Translation cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class TranslationCache:
+    """Persistent *source paragraph → translation* store, one *<lang>.json* per language.
+
+    Only the entries looked up during a run are written back, so paragraphs deleted from
+    the README drop out instead of piling up. Bump *VERSION* whenever keys or stored
+    values change meaning; older files are then discarded.
+    """
+
+    VERSION: ClassVar[int] = 2
+
+    directory: Path
+    entries: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    used: Dict[str, Set[str]] = field(default_factory=dict)
+    dirty: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def load(cls, cfg: Config) -> "TranslationCache":
+        """Return a cache for *cfg*; language files are read lazily on first access."""
+        return cls(cfg.cache_dir)
+
+    def _path(self, lang: str) -> Path:
+        return self.directory / f"{lang}.json"
+
+    def _entries(self, lang: str) -> Dict[str, str]:
+        """Return the entries of *lang*; a missing or corrupt file yields an empty dict."""
+        if lang in self.entries:
+            return self.entries[lang]
+        path = self._path(lang)
+        try:
+            data = json_loads(path.read_bytes())
+        except FileNotFoundError:
+            data = {}
+        except Exception as exc:
+            logging.warning("Ignoring unreadable cache %s: %s", path, exc)
+            data = {}
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            data = {}
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            entries = {}
+        return self.entries.setdefault(lang, entries)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)  # every language looks up the same paragraphs
+    def _key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, text: str, lang: str) -> str | None:
+        key = self._key(text)
+        self.used.setdefault(lang, set()).add(key)
+        return self._entries(lang).get(key)
+
+    def put(self, text: str, lang: str, translated: str) -> None:
+        key = self._key(text)
+        self.used.setdefault(lang, set()).add(key)
+        self._entries(lang)[key] = translated
+        self.dirty.add(lang)
+
+    def save(self) -> None:
+        """Write back every language touched in this run, keeping only the entries used.
+
+        Best effort: the cache only saves API calls, so failing to write it is logged
+        and never allowed to fail the commit.
+        """
+        for lang, used in self.used.items():
+            entries = self._entries(lang)
+            kept = {key: value for key, value in entries.items() if key in used}
+            if lang not in self.dirty and len(kept) == len(entries):
+                continue
+            path = self._path(lang)
+            tmp = path.with_suffix(".tmp")
+            data = {"version": self.VERSION, "entries": kept}
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_bytes(json_dumps(data))
+                tmp.replace(path)
+            except OSError as exc:
+                logging.warning("Could not write translation cache %s: %s", path, exc)
+                continue
+            self.entries[lang] = kept
+        self.dirty.clear()
 
 # ---------------------------------------------------------------------------
 # Translation helpers
 # ---------------------------------------------------------------------------
 
 
+def _import_deepl():  # noqa: ANN202 – returns the module
+    """Import the DeepL SDK on first use, exiting with a hint if it is not installed."""
+    try:
+        import deepl
+    except ModuleNotFoundError:
+        logging.error("deepl package not installed. Install with 'pip install deepl'.")
+        sys.exit(1)
+    return deepl
+
+
+@functools.lru_cache(maxsize=1)
+def _get_translator(key: str) -> deepl.Translator:
+    """Return a process‑wide Translator so its HTTPS keep‑alive pool outlives a single run.
+
+    All language batches share this one instance and therefore one *requests.Session*.
+    """
+    return _import_deepl().Translator(key, send_platform_info=False)
+
+
 def load_api_key() -> str | None:
-    """Return *DEEPL_API_KEY* from either *.env* or the current environment."""
+    """Return *DEEPL_API_KEY* from either the current environment or *.env*."""
+    key = os.getenv("DEEPL_API_KEY")
+    if key:  # already exported – no need to import dotenv and parse .env at all
+        return key
+
+    from dotenv import load_dotenv
+
     load_dotenv()
     return os.getenv("DEEPL_API_KEY")
 
 
-def translate_body(text: str, tr: deepl.Translator, lang: str) -> str | None:
-    """Translate *text* to *lang* while safeguarding code blocks & emoji."""
-    cleaned, mapping = protect_segments(text)
+DEEPL_MAX_TEXTS = 50  # texts per /v2/translate request
+DEEPL_MAX_BYTES = 120 * 1024  # encoded texts per request, below the 128 KiB body limit
+DEEPL_MAX_CONCURRENCY = 5  # parallel requests DeepL tolerates before throttling with 429s
+DEFAULT_CONCURRENCY = 4
+
+
+def _concurrency() -> int:
+    """Return *README_I18N_CONCURRENCY*, or *DEFAULT_CONCURRENCY* if unset or invalid."""
+    raw = os.getenv("README_I18N_CONCURRENCY")
+    if raw is None:
+        return DEFAULT_CONCURRENCY
     try:
-        translated = cleaned if lang == "EN" else tr.translate_text(cleaned, target_lang=lang).text
-    except deepl.DeepLException as exc:
-        logging.error("Error translating to %s: %s", lang, exc)
-        return None
-    return restore_segments(translated, mapping)
+        return int(raw)
+    except ValueError:
+        logging.warning(
+            "Ignoring README_I18N_CONCURRENCY=%r (not an integer); using %d.",
+            raw,
+            DEFAULT_CONCURRENCY,
+        )
+        return DEFAULT_CONCURRENCY
+
+
+def _batches(texts: Sequence[str]) -> Iterator[List[str]]:
+    """Split *texts* into as few chunks as DeepL accepts per request.
+
+    Sizes are measured as the SDK sends them – JSON with `\\uXXXX` escapes, which grows
+    CJK or Cyrillic text two to three times over its UTF‑8 size – plus the list separator.
+    """
+    batch: List[str] = []
+    size = 0
+    for text in texts:
+        length = len(json.dumps(text)) + 2
+        if batch and (len(batch) == DEEPL_MAX_TEXTS or size + length > DEEPL_MAX_BYTES):
+            yield batch
+            batch, size = [], 0
+        batch.append(text)
+        size += length
+    if batch:
+        yield batch
+
+
+def translate_body(
+    text: str,
+    tr: deepl.Translator,
+    lang: str,
+    cache: TranslationCache | None = None,
+    source_lang: str | None = None,
+) -> Tuple[str, List[str]] | None:
+    """Translate *text* and the header labels to *lang* in as few DeepL requests as possible.
+
+    The body is split into paragraphs (code blocks & emoji safeguarded) followed by
+    *HEADER_STRINGS* unless the bundled static labels cover *lang*; only paragraphs
+    missing from *cache* are sent to the API. Returns *(body, labels)* or *None* on failure.
+    *text* is returned as is when *lang* equals its *source_lang*.
+    """
+    static = _load_static_labels().get(lang.upper())
+    if source_lang is not None and lang.upper() == source_lang.upper():
+        return text, list(static or HEADER_STRINGS)  # identity: skip the regex scans entirely
+    extra = () if static else HEADER_STRINGS
+    cleaned, mapping = protect_segments(text)
+    paragraphs = [*cleaned.split("\n\n"), *extra]
+    # Cache keys are the original paragraphs, so shifted sentinel numbers don't cause misses.
+    result = [restore_segments(para, mapping) for para in paragraphs]
+
+    # Unique source paragraph → positions it occurs at (badges, headings, … repeat).
+    todo: Dict[str, List[int]] = {}
+    for i, source in enumerate(result):
+        # Blank and sentinel-only paragraphs (a lone code block, …) are kept verbatim: the
+        # API rejects the former and would only bill for – and may rewrite – the latter.
+        if not SENTINEL_PATTERN.sub("", paragraphs[i]).strip():
+            continue
+        hit = cache.get(source, lang) if cache is not None else None
+        if hit is not None:
+            result[i] = hit
+        else:
+            todo.setdefault(source, []).append(i)
+
+    if todo:
+        sources = [paragraphs[positions[0]] for positions in todo.values()]
+        try:
+            response = [
+                res
+                for batch in _batches(sources)
+                for res in tr.translate_text(batch, target_lang=lang.upper())
+            ]
+        except _import_deepl().DeepLException as exc:
+            logging.error("Error translating to %s: %s", lang, exc)
+            return None
+        for (source, positions), res in zip(todo.items(), response):
+            translated = restore_segments(res.text, mapping)
+            if cache is not None:
+                cache.put(source, lang, translated)
+            for i in positions:
+                result[i] = translated
+
+    split = len(result) - len(extra)
+    return "\n\n".join(result[:split]), list(static) if static else result[split:]
+
+
+def _write_translation(
+    readme: Path,
+    source_body: str,
+    lang: str,
+    text: str,
+    labels: Sequence[str],
+    cfg: Config,
+) -> Path:
+    """Write the translated *text* with its header and fingerprint; return the target."""
+    target = _target_path(readme, lang, cfg)
+    fingerprint = _fingerprint(source_body, cfg, target)
+    # Header and body are assembled in memory so every file is written exactly once.
+    target.write_text(_with_header(text, target, cfg, lang, labels, fingerprint), "utf-8")
+    logging.info("Generated %s", target.relative_to(repo_root()))
+    return target
 
 
 def build_translations(readme: Path, key: str, cfg: Config) -> List[Path]:
-    """Return a list of newly generated translation files."""
-    translator = deepl.Translator(key)
-    source_body = _strip_header(readme.read_text("utf-8"), cfg)
+    """Return the translation files that are up to date with *readme* after this run.
+
+    Files whose embedded fingerprint already matches are left alone; if all match, neither
+    a DeepL client is created nor a request sent. Stale languages are translated
+    concurrently by up to *README_I18N_CONCURRENCY* (default 4, capped at
+    *DEEPL_MAX_CONCURRENCY*) threads; 429 and 5xx responses are retried with jittered
+    exponential backoff by the DeepL SDK itself.
+    """
+    source_body = _strip_header(read_staged(readme), cfg)
+    current: List[Path] = []
+    stale: List[str] = []
+    for lang in cfg.languages:
+        target = _target_path(readme, lang, cfg)
+        if _is_current(target, _fingerprint(source_body, cfg, target)):
+            current.append(target)
+        else:
+            stale.append(lang)
+    if not stale:
+        logging.info("All translations are up to date.")
+        return current
+
+    translator = _get_translator(key)
+    cache = TranslationCache.load(cfg)
+    workers = max(1, min(len(stale), _concurrency(), DEEPL_MAX_CONCURRENCY))
 
     cfg.output_dir.mkdir(parents=True, exist_ok=True)
-    created: List[Path] = []
-    for lang in cfg.languages:
-        text = translate_body(source_body, translator, lang)
-        if text is None:
-            continue
+    try:
+        # All threads share *translator* and thus its requests.Session: TLS connections to
+        # DeepL are pooled and reused across languages instead of being set up per request.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                lambda lang: translate_body(
+                    source_body, translator, lang, cache, source_lang=cfg.source_lang
+                ),
+                stale,
+            )
+            # Files are written here, one after another, as results arrive in order.
+            for lang, result in zip(stale, results):
+                if result is not None:
+                    text, labels = result
+                    current.append(
+                        _write_translation(readme, source_body, lang, text, labels, cfg)
+                    )
+    finally:
+        cache.save()
+    return current
+
+# ---------------------------------------------------------------------------
+# Daemon mode (keeps imports, compiled regexes & caches warm between commits)
+# ---------------------------------------------------------------------------
+
+LOG_FORMAT = "%(levelname)s: %(message)s"
+DAEMON_IDLE_TIMEOUT = 30 * 60  # seconds without a request before the daemon exits
+# Environment a run depends on. It is sent along with every request rather than inherited
+# once from whichever hook happened to spawn the daemon (git points GIT_INDEX_FILE at a
+# per-commit index, keys and settings may change between commits).
+FORWARDED_ENV_PREFIXES = ("GIT_", "README_I18N_")
+FORWARDED_ENV = frozenset({"DEEPL_API_KEY"})
+
+
+def _forwarded(name: str) -> bool:
+    return name in FORWARDED_ENV or name.startswith(FORWARDED_ENV_PREFIXES)
+
+
+@functools.cache
+def _code_stamp() -> List[int]:
+    """Return *[mtime_ns, size]* of this file; the daemon refuses clients running other code."""
+    st = Path(__file__).stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _socket_path() -> Path:
+    """Return the per‑repository socket the daemon listens on.
+
+    Without *XDG_RUNTIME_DIR* (private to the user by definition) the socket lives in a
+    0700 directory of our own below the temp dir, so other users can't answer in its place.
+    """
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        base = Path(runtime_dir)
+    else:
+        base = Path(tempfile.gettempdir()) / f"readme-i18n-{os.getuid()}"
+        base.mkdir(mode=0o700, exist_ok=True)
+        st = base.lstat()
+        if base.is_symlink() or not base.is_dir() or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise PermissionError(f"{base} is not a private directory")
+    tag = hashlib.sha256(str(repo_root()).encode("utf-8")).hexdigest()[:12]
+    return base / f"readme-i18n-{tag}.sock"
+
+
+def _apply_request(request: Dict[str, Any]) -> None:
+    """Adopt the client's working directory and forwarded environment for one request."""
+    for name in [name for name in os.environ if _forwarded(name)]:
+        del os.environ[name]
+    os.environ.update(request.get("env", {}))
+    os.chdir(request.get("cwd") or repo_root())
+    # These depend on cwd and GIT_* – rediscover them under the client's environment.
+    _repository.cache_clear()
+    repo_root.cache_clear()
+    git_dir.cache_clear()
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """Serve one hook invocation per connection: JSON request in, exit code + log out."""
+
+    def handle(self) -> None:
+        request = json.loads(self.rfile.read().decode("utf-8"))
+        if request.get("stamp") != _code_stamp():
+            # hook.py changed since start-up: let the client run the new code in-process
+            # and stop, so that the next commit spawns an up-to-date daemon.
+            self.server.done = True  # type: ignore[attr-defined]
+            self.wfile.write(json.dumps({"stale": True}).encode("utf-8"))
+            return
+
+        output = io.StringIO()
+        handler = logging.StreamHandler(output)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root = logging.getLogger()
+        level = root.level
+        root.addHandler(handler)
+        try:
+            _apply_request(request)
+            args = _build_parser().parse_args(request.get("argv", []))
+            root.setLevel(_log_level(args))  # requests are served one at a time
+            code = run(args)
+        except SystemExit as exc:  # argparse errors must not take the daemon down
+            code = exc.code if isinstance(exc.code, int) else 1
+        except Exception:  # noqa: BLE001 – report to the client, keep serving
+            logging.exception("readme-i18n daemon request failed")
+            code = 1
+        finally:
+            root.removeHandler(handler)
+            root.setLevel(level)
+        reply = {"code": code, "log": output.getvalue()}
+        self.wfile.write(json.dumps(reply).encode("utf-8"))
+
+
+def serve() -> int:
+    """Answer hook invocations on *_socket_path()* until idle for *DAEMON_IDLE_TIMEOUT*."""
+    path = _socket_path()
+    path.unlink(missing_ok=True)  # left over by a daemon that didn't shut down cleanly
+    _code_stamp()  # pin the stamp of the code this process has loaded
+
+    with socketserver.UnixStreamServer(str(path), _DaemonHandler) as server:
+        path.chmod(0o600)
+        server.done = False  # type: ignore[attr-defined] – set when idle or outdated
+
+        def _on_timeout() -> None:
+            server.done = True  # type: ignore[attr-defined]
+
+        server.timeout = DAEMON_IDLE_TIMEOUT
+        server.handle_timeout = _on_timeout  # type: ignore[method-assign]
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # still remove the socket
+        logging.info("Daemon listening on %s", path)
+        try:
+            while not server.done:  # type: ignore[attr-defined]
+                server.handle_request()
+        finally:
+            path.unlink(missing_ok=True)
+    return 0
+
 
-        fname = cfg.template.format(basename=readme.stem, lang=lang, ext=readme.suffix)
-        target = cfg.output_dir / fname
-        target.write_text(text, "utf-8")
-        logging.info("Generated %s", target.relative_to(REPO_ROOT))
-        ensure_header(target, cfg, lang, translator)
-        created.append(target)
+def _forward(argv: List[str]) -> int | None:
+    """Let a running daemon handle *argv*; start one and return *None* if none answers."""
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": {name: value for name, value in os.environ.items() if _forwarded(name)},
+        "stamp": _code_stamp(),
+    }
+    try:
+        path = _socket_path()
+        if path.stat().st_uid != os.getuid():
+            logging.warning("Ignoring daemon socket %s owned by another user.", path)
+            return None
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            reply = json.loads(b"".join(iter(lambda: sock.recv(65536), b"")).decode("utf-8"))
+    except (FileNotFoundError, ConnectionRefusedError):
+        # Nobody listening: warm one up for the next commit and handle this one in‑process.
+        # GIT_* of this commit (its index above all) must not stick to the daemon.
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--daemon"],
+            cwd=repo_root(),
+            env={name: value for name, value in os.environ.items() if not name.startswith("GIT_")},
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        return None
+    except (OSError, ValueError) as exc:
+        logging.debug("Daemon unusable, running in-process: %s", exc)
+        return None
 
-    return created
+    if reply.get("stale"):
+        logging.debug("Daemon runs outdated code, running in-process.")
+        return None
+    sys.stderr.write(reply.get("log", ""))
+    return int(reply.get("code", 1))
 
 # ---------------------------------------------------------------------------
 # CLI entry point
 # ---------------------------------------------------------------------------
 
 
-def main(argv: List[str] | None = None) -> int:  # noqa: C901 – "main" is allowed to be long
-    """Parse CLI args, run translation workflow and exit with an appropriate code."""
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Translate README via DeepL and maintain multilingual headers.",
     )
     parser.add_argument("files", nargs="*", help="Paths from pre-commit (optional).")
     parser.add_argument("--check", action="store_true", help="Exit 1 if README.md is staged.")
-    args = parser.parse_args(argv)
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Report progress, not just problems."
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Serve hook runs from a warm background process (see README_I18N_DAEMON).",
+    )
+    return parser
+
 
-    logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
+def _log_level(args: argparse.Namespace) -> int:
+    """Return the root log level for *args*: quiet unless *-v* or *README_I18N_DEBUG*."""
     if os.getenv("README_I18N_DEBUG"):
-        logging.getLogger().setLevel(logging.DEBUG)
+        return logging.DEBUG
+    return logging.INFO if args.verbose else logging.WARNING
 
+
+def run(args: argparse.Namespace) -> int:  # noqa: C901 – the workflow is allowed to be long
+    """Run the translation workflow for parsed CLI *args* and return the exit code."""
     cfg = Config.load()
     logging.debug("Config: %s", cfg)
 
     # 1) Ensure the *source* README always has a header so that users see the language switcher.
-    if ensure_header(README_PATH, cfg, cfg.source_lang, None):
-        subprocess.run(["git", "add", str(README_PATH)], check=False)
+    readme = readme_path()
+    if ensure_header(readme, cfg, cfg.source_lang):
+        stage([readme])
 
     # 2) Determine the list of staged files (comes from pre‑commit when run via hook)
-    staged = args.files or subprocess.getoutput("git diff --cached --name-only").splitlines()
-    if README_PATH.name not in staged:
+    staged = frozenset(args.files or staged_files())
+    if readme.name not in staged:
         logging.info("README.md not staged; nothing to do.")
         return 0
 
+    # Only the source language configured: nothing to translate, which is not a failure.
+    if not cfg.languages:
+        logging.info("No target languages configured; nothing to translate.")
+        return 0
+
     # 3) When --check is supplied we bail out early so lint‑staged can fail the commit.
     if args.check:
         return 1
@@ -336,13 +1154,31 @@ def main(argv: List[str] | None = None) -> int:  # noqa: C901 – "main" is allo
         logging.warning("No DEEPL_API_KEY found – skipping translation.")
         return 0
 
-    created = build_translations(README_PATH, api_key, cfg)
+    created = build_translations(readme, api_key, cfg)
     if not created:
         return 1
 
-    subprocess.run(["git", "add", *map(str, created)], check=False)
+    stage(created)
     return 0
 
 
+def main(argv: List[str] | None = None) -> int:
+    """Parse CLI args, run translation workflow and exit with an appropriate code."""
+    args = _build_parser().parse_args(argv)
+
+    logging.basicConfig(format=LOG_FORMAT, level=_log_level(args))
+
+    if args.daemon:
+        return serve()
+
+    # Opt‑in: hand the work to a warm daemon to skip interpreter start‑up and imports.
+    if os.getenv("README_I18N_DAEMON") and hasattr(socket, "AF_UNIX"):
+        code = _forward(sys.argv[1:] if argv is None else list(argv))
+        if code is not None:
+            return code
+
+    return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())